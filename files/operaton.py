@@ -18,6 +18,9 @@ Usage:
     # Load environment variables from localStorage (required for REST API)
     await operaton.load_env()
     
+    # Or load the environment and all libraries at once
+    await operaton.prefetch_all()
+    
     # REST API
     from operaton import Operaton
     definitions = Operaton.get('/process-definition')
@@ -35,30 +38,49 @@ Usage:
 """
 
 import asyncio
+import atexit
 import js
 import json
 import os
+import secrets
+import time
+
+from collections import OrderedDict
 
 from pyodide.ffi import create_proxy, to_js
+from pyodide.http import pyfetch
 
 
 # =============================================================================
 # Debug Configuration
 # =============================================================================
 
-def DEBUG() -> bool:
+def _debug_enabled() -> bool:
     """
     Check if debug mode is enabled.
     
-    Debug mode can be enabled by setting 'operaton-debug' to 'true' in localStorage.
-    This matches the behavior of the TypeScript extension.
+    Debug mode can be enabled by setting the OPERATON_DEBUG environment variable
+    to '1', or by setting 'operaton-debug' to 'true' in localStorage (where
+    available). The latter matches the behavior of the TypeScript extension.
     """
+    if os.environ.get('OPERATON_DEBUG') == '1':
+        return True
     try:
         return js.localStorage.getItem('operaton-debug') == 'true'
     except Exception:
         return False
 
 
+# Evaluated once at import, so that debug checks on the hot paths
+# do not cross into JavaScript on every call
+_DEBUG = _debug_enabled()
+
+
+def DEBUG() -> bool:
+    """Check if debug mode is enabled (as determined at import time)."""
+    return _DEBUG
+
+
 # =============================================================================
 # BroadcastChannel Bridge
 # =============================================================================
@@ -66,6 +88,16 @@ def DEBUG() -> bool:
 # BroadcastChannel name (must match the extension)
 CHANNEL_NAME = 'operaton-bridge'
 
+# Response timeouts in seconds: localStorage is answered synchronously by the
+# extension, while bundles may first have to be downloaded
+LOCALSTORAGE_TIMEOUT = 2.0
+BUNDLE_TIMEOUT = 15.0
+
+# Seconds a GET response is reused for repeated requests of the same URL,
+# and the number of responses kept at most
+GET_CACHE_TTL = 1.0
+GET_CACHE_SIZE = 32
+
 
 class OperatonBridge:
     """
@@ -74,109 +106,180 @@ class OperatonBridge:
     """
     
     def __init__(self):
-        if DEBUG():
+        if _DEBUG:
             print(f"[OperatonBridge] Creating BroadcastChannel '{CHANNEL_NAME}'")
         self._channel = js.BroadcastChannel.new(CHANNEL_NAME)
+        # The bridge is created lazily from coroutines, so a loop is running
+        self._loop = asyncio.get_running_loop()
         self._pending_responses = {}
+        self._pending_batch = []
+        self._flush_scheduled = False
         self._request_id = 0
+        # The bridges of all workers share the channel and each numbers its
+        # requests from 1, so the extension echoes this ID in its responses
+        # and messages for other bridges are ignored
+        self._client_id = secrets.token_hex(8)
         # Set up message handler
         self._on_message_proxy = create_proxy(self._on_message)
         self._channel.onmessage = self._on_message_proxy
-        if DEBUG():
+        if _DEBUG:
             print(f"[OperatonBridge] BroadcastChannel created and message handler attached")
     
     def _on_message(self, event):
         """Handle messages from the extension."""
-        if DEBUG():
+        if _DEBUG:
             print(f"[OperatonBridge] Received message event: {event}")
         try:
-            data = event.data.to_py()
-            if DEBUG():
-                print(f"[OperatonBridge] Parsed message data: {data}")
-            request_id = data.get('request_id')
-            if DEBUG():
-                print(f"[OperatonBridge] Request ID from response: {request_id}, pending: {list(self._pending_responses.keys())}")
-            
-            if request_id and request_id in self._pending_responses:
-                future = self._pending_responses[request_id]
-                if not future.done():
-                    if DEBUG():
-                        print(f"[OperatonBridge] Resolving future for request {request_id}")
-                    future.set_result(data)
-                else:
-                    if DEBUG():
-                        print(f"[OperatonBridge] Future already done for request {request_id}")
+            # Keep the data as a JS object proxy: converting it with to_py()
+            # would deep-copy large payloads just to read the request ID
+            data = event.data
+            if getattr(data, 'client_id', None) != self._client_id:
+                return
+            if getattr(data, 'action', None) == 'batch_response':
+                for response in data.responses:
+                    self._resolve(response)
             else:
-                if DEBUG():
-                    print(f"[OperatonBridge] No pending request for ID {request_id}")
+                self._resolve(data)
         except Exception as e:
             print(f"[OperatonBridge] Error handling message: {e}")
             import traceback
             traceback.print_exc()
     
-    async def request(self, action: str, **kwargs) -> dict:
-        """Send a request to the extension and wait for response."""
+    def _resolve(self, data):
+        """Resolve the pending request future matching a response."""
+        request_id = getattr(data, 'request_id', None)
+        if _DEBUG:
+            print(f"[OperatonBridge] Request ID from response: {request_id}, pending: {list(self._pending_responses.keys())}")
+        
+        if request_id is not None and request_id in self._pending_responses:
+            future = self._pending_responses[request_id]
+            if not future.done():
+                if _DEBUG:
+                    print(f"[OperatonBridge] Resolving future for request {request_id}")
+                future.set_result(data)
+            else:
+                if _DEBUG:
+                    print(f"[OperatonBridge] Future already done for request {request_id}")
+        else:
+            if _DEBUG:
+                print(f"[OperatonBridge] No pending request for ID {request_id}")
+    
+    @staticmethod
+    def _js_message(**fields):
+        """
+        Build a JS message object.
+        
+        Scalar fields are assigned directly, which avoids the general-purpose
+        to_js() dict conversion for the small, flat bridge messages.
+        """
+        message = js.Object.new()
+        for key, value in fields.items():
+            if value is not None and not isinstance(value, (str, int, float, bool)):
+                value = to_js(value, dict_converter=js.Object.fromEntries)
+            setattr(message, key, value)
+        return message
+    
+    def _flush_batch(self):
+        """
+        Post all requests queued during the current event loop tick.
+        
+        A single queued request is posted as-is; several are coalesced into
+        one 'batch' message, answered by the extension with 'batch_response' messages.
+        """
+        self._flush_scheduled = False
+        batch, self._pending_batch = self._pending_batch, []
+        if not batch:
+            return
+        if len(batch) == 1:
+            js_message = batch[0]
+        else:
+            js_message = self._js_message(
+                action='batch', client_id=self._client_id, requests=to_js(batch)
+            )
+        if _DEBUG:
+            print(f"[OperatonBridge] Sending message: {js_message}")
+        self._channel.postMessage(js_message)
+        if _DEBUG:
+            print(f"[OperatonBridge] Posted {len(batch)} request(s), waiting for response...")
+    
+    async def request(self, action: str, timeout: float = 5.0, **kwargs):
+        """
+        Send a request to the extension and wait for response.
+        
+        Args:
+            action: The action to request
+            timeout: Seconds to wait for the response before giving up
+            **kwargs: Additional request fields
+            
+        Returns:
+            The response as a JavaScript object proxy; read its fields
+            with attribute access (e.g. response.value)
+        """
         self._request_id += 1
-        request_id = str(self._request_id)
+        request_id = self._request_id
         
-        loop = asyncio.get_event_loop()
-        response_future = loop.create_future()
+        response_future = self._loop.create_future()
         self._pending_responses[request_id] = response_future
         
-        # Send request via BroadcastChannel
-        message = {
-            'action': action,
-            'request_id': request_id,
-            **kwargs
-        }
-        if DEBUG():
-            print(f"[OperatonBridge] Sending message: {message}")
-        js_message = to_js(message, dict_converter=js.Object.fromEntries)
-        if DEBUG():
-            print(f"[OperatonBridge] JS message object: {js_message}")
-        self._channel.postMessage(js_message)
-        if DEBUG():
-            print(f"[OperatonBridge] Message posted, waiting for response...")
+        # Queue request to be sent via BroadcastChannel with others of this tick
+        self._pending_batch.append(
+            self._js_message(
+                action=action, client_id=self._client_id, request_id=request_id, **kwargs
+            )
+        )
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._loop.call_soon(self._flush_batch)
         
         try:
-            response = await asyncio.wait_for(response_future, timeout=30.0)
-            if DEBUG():
-                print(f"[OperatonBridge] Got response: {response}")
-            if response.get('action') == 'error':
-                raise RuntimeError(response.get('error', 'Unknown error'))
-            return response
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(timeout):
+                response = await response_future
+        except TimeoutError:
             print(f"[OperatonBridge] TIMEOUT waiting for response to {action}")
-            del self._pending_responses[request_id]
             raise RuntimeError(f"Timeout waiting for response to {action}")
         finally:
-            if request_id in self._pending_responses:
-                del self._pending_responses[request_id]
+            self._pending_responses.pop(request_id, None)
+        
+        if _DEBUG:
+            print(f"[OperatonBridge] Got response: {response}")
+        if getattr(response, 'action', None) == 'error':
+            raise RuntimeError(getattr(response, 'error', None) or 'Unknown error')
+        return response
     
     async def get_bpmn_moddle_bundle(self) -> str:
         """Get the bpmn-moddle UMD bundle code."""
-        response = await self.request('get_bpmn_moddle_bundle')
-        return response.get('bundle', '')
+        response = await self.request('get_bpmn_moddle_bundle', timeout=BUNDLE_TIMEOUT)
+        return getattr(response, 'bundle', None) or ''
     
     async def get_localstorage(self, key: str) -> str | None:
         """Get a value from localStorage."""
-        response = await self.request('get_localstorage', key=key)
-        return response.get('value')
+        response = await self.request('get_localstorage', timeout=LOCALSTORAGE_TIMEOUT, key=key)
+        return getattr(response, 'value', None)
+    
+    async def get_localstorage_version(self, key: str) -> str | None:
+        """Get the version of a localStorage value, which changes with the value."""
+        response = await self.request(
+            'get_localstorage_version', timeout=LOCALSTORAGE_TIMEOUT, key=key
+        )
+        return getattr(response, 'version', None)
     
     async def set_localstorage(self, key: str, value: str) -> bool:
         """Set a value in localStorage."""
-        response = await self.request('set_localstorage', key=key, value=value)
-        return response.get('success', False)
+        response = await self.request(
+            'set_localstorage', timeout=LOCALSTORAGE_TIMEOUT, key=key, value=value
+        )
+        return bool(getattr(response, 'success', False))
     
     async def remove_localstorage(self, key: str) -> bool:
         """Remove a value from localStorage."""
-        response = await self.request('remove_localstorage', key=key)
-        return response.get('success', False)
+        response = await self.request('remove_localstorage', timeout=LOCALSTORAGE_TIMEOUT, key=key)
+        return bool(getattr(response, 'success', False))
     
     async def get_localstorage_keys(self) -> list[str]:
         """Get all keys in localStorage."""
-        response = await self.request('get_localstorage_keys')
-        return response.get('keys', [])
+        response = await self.request('get_localstorage_keys', timeout=LOCALSTORAGE_TIMEOUT)
+        keys = getattr(response, 'keys', None)
+        return keys.to_py() if keys is not None else []
     
     def close(self):
         """Close the BroadcastChannel."""
@@ -189,13 +292,133 @@ _bridge = None
 
 
 def get_bridge() -> OperatonBridge:
-    """Get or create the global bridge instance."""
+    """
+    Get or create the global bridge instance.
+    
+    Only one BroadcastChannel is opened per worker; it is closed again
+    by close_bridge() at interpreter exit.
+    """
     global _bridge
     if _bridge is None:
         _bridge = OperatonBridge()
+        atexit.register(close_bridge)
     return _bridge
 
 
+def close_bridge():
+    """Close the global bridge instance, if one has been created."""
+    global _bridge
+    if _bridge is not None:
+        _bridge.close()
+        _bridge = None
+        atexit.unregister(close_bridge)
+
+
+# =============================================================================
+# Bundle Fetching
+# =============================================================================
+
+# Globals the library bundles assign their exports to, by bundle name
+_LIBRARY_GLOBALS = {
+    'bpmn-moddle': 'BpmnModdle',
+    'dmn-moddle': 'DmnModdle',
+    'bpmn-js-differ': 'bpmnDiff',
+}
+
+# Library loads, keyed by bundle name; each future resolves to the global
+# the bundle exports, and failed loads are dropped so they can be retried
+_libraries = {}
+
+# Fetches and evaluates a bundle from a URL, so that the bundle code never
+# crosses into Python; the bundle runs as the body of a new Function
+_LOAD_BUNDLE_JS = """
+return fetch(url)
+    .then((response) => response.text())
+    .then((code) => { new Function(code)(); });
+"""
+
+# Compiled bundle loading function, created on first use
+_load_bundle_from_url = None
+
+
+def _library_loaded(name: str) -> bool:
+    """Return True if the library bundle has been loaded successfully."""
+    future = _libraries.get(name)
+    return (
+        future is not None
+        and future.done()
+        and not future.cancelled()
+        and future.exception() is None
+    )
+
+
+def _forget_failed_library(name: str, future: asyncio.Future):
+    """Drop a failed library load so that the next caller retries it."""
+    if future.cancelled() or future.exception() is not None:
+        if _libraries.get(name) is future:
+            del _libraries[name]
+
+
+def _start_library(name: str) -> asyncio.Future:
+    """
+    Start loading a JavaScript library bundle, unless it is already loading.
+    
+    Concurrent callers for the same bundle share a single load, which
+    fetches and evaluates the bundle at most once. The load sends its bridge
+    request in the next event loop tick.
+    
+    Args:
+        name: The bundle name (e.g. 'dmn-moddle')
+        
+    Returns:
+        The shared load future, resolving to the exported global
+    """
+    future = _libraries.get(name)
+    if future is None:
+        future = asyncio.ensure_future(
+            _load_library_from_extension(name, _LIBRARY_GLOBALS[name])
+        )
+        _libraries[name] = future
+        future.add_done_callback(lambda f: _forget_failed_library(name, f))
+    return future
+
+
+async def _load_library(name: str):
+    """Load a JavaScript library bundle from the extension into the worker."""
+    # Shield the shared load from cancellation of any single caller
+    return await asyncio.shield(_start_library(name))
+
+
+async def _load_library_from_extension(name: str, global_name: str):
+    """
+    Load a bundle from the Blob URL provided by the extension.
+    
+    Only the URL travels over the BroadcastChannel; the worker reads
+    the bundle itself instead of receiving a structured-clone copy.
+    """
+    global _load_bundle_from_url
+    
+    # Check if already loaded
+    if hasattr(js, global_name):
+        return getattr(js, global_name)
+    
+    response = await get_bridge().request(
+        'get_bundle_url', timeout=BUNDLE_TIMEOUT, name=name
+    )
+    url = getattr(response, 'url', None)
+    if not url:
+        raise ImportError(f"Failed to get {name} bundle from extension")
+    if _load_bundle_from_url is None:
+        _load_bundle_from_url = js.Function.new('url', _LOAD_BUNDLE_JS)
+    await _load_bundle_from_url(url)
+    
+    if not hasattr(js, global_name):
+        raise ImportError(f"{global_name} not found after evaluating bundle")
+    if _DEBUG:
+        print(f"{name}: Loaded successfully via BroadcastChannel")
+    return getattr(js, global_name)
+
+
 # =============================================================================
 # Environment Loading
 # =============================================================================
@@ -203,6 +426,9 @@ def get_bridge() -> OperatonBridge:
 # Track if environment has been loaded
 _env_loaded = False
 
+# Version of the localStorage 'env' value that was loaded
+_env_version = None
+
 
 async def _load_env_async():
     """
@@ -215,28 +441,44 @@ async def _load_env_async():
     - OPERATON_ADMIN_API
     - etc.
     
-    This function reads that data and updates os.environ.
+    This function reads that data and updates os.environ. Once loaded, it
+    only asks the extension for the version of the 'env' value and reloads
+    the environment when that has changed; if the extension does not answer,
+    the loaded environment is kept.
     """
-    global _env_loaded
-    
-    if _env_loaded:
-        return
+    global _env_loaded, _env_version
     
     bridge = get_bridge()
-    env_json = await bridge.get_localstorage('env')
+    if _env_loaded:
+        try:
+            version = await bridge.get_localstorage_version('env')
+        except RuntimeError as e:
+            # Keep the environment already loaded rather than failing
+            if _DEBUG:
+                print(f"[operaton] Could not check the env version, keeping loaded env: {e}")
+            return
+        if version == _env_version:
+            return
+    
+    response = await bridge.request(
+        'get_localstorage', timeout=LOCALSTORAGE_TIMEOUT, key='env'
+    )
+    env_json = getattr(response, 'value', None)
     
     if env_json:
         try:
             env_data = json.loads(env_json)
             for key, value in env_data.items():
                 os.environ[key] = str(value)
-            if DEBUG():
+            if _DEBUG:
                 print(f"[operaton] Loaded {len(env_data)} environment variables from localStorage")
+            _configure_rest_client()
             _env_loaded = True
+            _env_version = getattr(response, 'version', None)
         except json.JSONDecodeError as e:
             print(f"[operaton] Error parsing env from localStorage: {e}")
     else:
-        if DEBUG():
+        if _DEBUG:
             print("[operaton] No 'env' key found in localStorage")
 
 
@@ -252,6 +494,9 @@ async def load_env():
     
     Call this before using Operaton API methods:
         await operaton.load_env()
+    
+    Calling it again picks up a changed environment (e.g. a renewed CSRF
+    token), while an unchanged one is not transferred or parsed again.
     """
     await _load_env_async()
 
@@ -260,12 +505,93 @@ async def load_env():
 # REST API Client
 # =============================================================================
 
+# REST client configuration, prepared once per environment load; the headers
+# are kept both as dicts (for pyfetch) and as JS objects (for _xhr)
+_base_url = None
+_csrf_headers = {}
+_json_headers = {}
+_csrf_headers_js = None
+_json_headers_js = None
+
+# Makes a synchronous request in a single call from Python, instead of
+# crossing into JS for open(), each setRequestHeader() and send()
+_XHR_JS = """
+const request = new XMLHttpRequest();
+request.open(method, url, false);
+if (headers) {
+    for (const [name, value] of Object.entries(headers)) {
+        request.setRequestHeader(name, value);
+    }
+}
+request.send(body ?? null);
+return [request.status, request.responseText];
+"""
+
+# Compiled synchronous request function, created on first use
+_xhr = None
+
+# Marks requests without a body, as None is sent as a JSON null body
+_NO_BODY = object()
+
+# Recent GET response texts, keyed by URL, as (time, text) tuples, oldest
+# first; cleared by any other request, since that may change what the
+# engine returns
+_get_cache = OrderedDict()
+
+
+def _cached_get(url):
+    """Return the cached response text for a URL, or None if missing or expired."""
+    if GET_CACHE_TTL <= 0:
+        return None
+    entry = _get_cache.get(url)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] >= GET_CACHE_TTL:
+        del _get_cache[url]
+        return None
+    return entry[1]
+
+
+def _cache_get(url, text):
+    """Cache a GET response text, dropping expired and excess responses."""
+    # A TTL or size of 0 turns caching off
+    if GET_CACHE_TTL <= 0 or GET_CACHE_SIZE <= 0:
+        return
+    now = time.monotonic()
+    _get_cache.pop(url, None)
+    _get_cache[url] = (now, text)
+    while len(_get_cache) > GET_CACHE_SIZE:
+        _get_cache.popitem(last=False)
+    while _get_cache and now - next(iter(_get_cache.values()))[0] >= GET_CACHE_TTL:
+        _get_cache.popitem(last=False)
+
+
+def _configure_rest_client():
+    """Prepare the base API URL and request headers from os.environ."""
+    global _base_url, _csrf_headers, _json_headers, _csrf_headers_js, _json_headers_js
+    engine_api = os.environ.get("OPERATON_ENGINE_API")
+    _base_url = engine_api.rstrip("/") if engine_api is not None else None
+    _csrf_headers = {"X-XSRF-TOKEN": os.environ.get("OPERATON_CSRF_TOKEN", "")}
+    _json_headers = {"Content-Type": "application/json", **_csrf_headers}
+    _csrf_headers_js = to_js(_csrf_headers, dict_converter=js.Object.fromEntries)
+    _json_headers_js = to_js(_json_headers, dict_converter=js.Object.fromEntries)
+
+
 class Operaton:
     """
     REST API client for Operaton (Camunda 7) engine.
     
-    Provides static methods for common REST operations.
+    Provides static methods for common REST operations. The plain methods use
+    synchronous requests and are safe to call from widget callbacks; the
+    `*_async` variants use `fetch()` and do not block the worker while waiting:
+        definitions = await Operaton.get_async('/process-definition')
+    
     Environment variables must be loaded first via `await operaton.load_env()`.
+    
+    GET responses are reused for the same URL for GET_CACHE_TTL seconds
+    (at most GET_CACHE_SIZE of them are kept; set either to 0 to turn this
+    off); POST, PUT and DELETE requests clear them, and so does
+    `Operaton.invalidate()`. Pass `cache=False` to get a fresh response.
     """
     
     @staticmethod
@@ -279,75 +605,115 @@ class Operaton:
     @staticmethod
     def _get_base_url():
         """Get the base API URL."""
-        Operaton._check_env()
-        return os.environ["OPERATON_ENGINE_API"].rstrip("/")
-    
+        # The base URL is only set once the environment has been loaded,
+        # so the environment check is needed only when it is missing
+        if _base_url is None:
+            Operaton._check_env()
+            raise KeyError("OPERATON_ENGINE_API")
+        return _base_url
+
+    @staticmethod
+    def _url(path):
+        """Build the full API URL for a path."""
+        base_url = _base_url if _base_url is not None else Operaton._get_base_url()
+        return base_url + path if path.startswith("/") else base_url + "/" + path
+
+    @staticmethod
+    def _body(data):
+        """Encode request data as JSON, passing str and bytes bodies through as-is."""
+        if isinstance(data, str):
+            return data
+        if isinstance(data, bytes):
+            return to_js(data)
+        return json.dumps(data)
+
+    @staticmethod
+    def _request(method, path, statuses, data=_NO_BODY, headers=None, raw=False, cache=True):
+        """Make a synchronous request to the Operaton REST API."""
+        global _xhr
+        if _xhr is None:
+            _xhr = js.Function.new('method', 'url', 'body', 'headers', _XHR_JS)
+        url = Operaton._url(path)
+        text = _cached_get(url) if cache and method == "GET" else None
+        if text is None:
+            body = Operaton._body(data) if data is not _NO_BODY else None
+            status, text = _xhr(method, url, body, headers)
+            Operaton._update_cache(method, url, status in statuses, text)
+            assert status in statuses, text
+        return text if raw else json.loads(text or 'null')
+
+    @staticmethod
+    def _update_cache(method, url, ok, text):
+        """Cache a successful GET response, or clear the cache after other requests."""
+        if method != "GET":
+            _get_cache.clear()
+        elif ok:
+            _cache_get(url, text)
+
     @staticmethod
-    def _get_csrf_token():
-        """Get the CSRF token."""
-        Operaton._check_env()
-        return os.environ.get("OPERATON_CSRF_TOKEN", "")
+    def invalidate(prefix=''):
+        """
+        Drop cached GET responses.
+        
+        Args:
+            prefix: Only drop responses for API paths starting with this prefix
+                (e.g. '/process-definition'); all responses by default
+        """
+        if not prefix or _base_url is None:
+            _get_cache.clear()
+            return
+        url_prefix = Operaton._url(prefix)
+        for url in [url for url in _get_cache if url.startswith(url_prefix)]:
+            del _get_cache[url]
 
     @staticmethod
-    def get(path, raw=False):
+    def get(path, raw=False, cache=True):
         """
         Make a GET request to the Operaton REST API.
         
         Args:
             path: API path (e.g., '/process-definition')
             raw: If True, return raw response text instead of parsing JSON
+            cache: If False, always request a fresh response (e.g. when polling)
             
         Returns:
             Parsed JSON response or raw text if raw=True
         """
-        url = Operaton._get_base_url() + "/" + path.lstrip("/")
-        request = js.XMLHttpRequest.new()
-        request.open("GET", url, False)
-        request.send(None)
-        assert request.status in [200], request.responseText
-        return request.responseText if raw else json.loads(request.responseText or 'null')
+        return Operaton._request("GET", path, [200], raw=raw, cache=cache)
 
     @staticmethod
-    def post(path, data):
+    def post(path, data, raw=False):
         """
         Make a POST request to the Operaton REST API.
         
         Args:
             path: API path
-            data: Data to send as JSON
+            data: Data to send as JSON (str or bytes are sent as-is)
+            raw: If True, return raw response text instead of parsing JSON
             
         Returns:
-            Parsed JSON response
+            Parsed JSON response or raw text if raw=True
         """
-        url = Operaton._get_base_url() + "/" + path.lstrip("/")
-        request = js.XMLHttpRequest.new()
-        request.open("POST", url, False)
-        request.setRequestHeader("Content-Type", "application/json")
-        request.setRequestHeader("X-XSRF-TOKEN", Operaton._get_csrf_token())
-        request.send(json.dumps(data))
-        assert request.status in [200, 204], request.responseText
-        return json.loads(request.responseText or 'null')
+        return Operaton._request(
+            "POST", path, [200, 204], data=data, headers=_json_headers_js, raw=raw
+        )
         
     @staticmethod
-    def put(path, data):
+    def put(path, data, raw=False):
         """
         Make a PUT request to the Operaton REST API.
         
         Args:
             path: API path
-            data: Data to send as JSON
+            data: Data to send as JSON (str or bytes are sent as-is)
+            raw: If True, return raw response text instead of parsing JSON
             
         Returns:
-            Parsed JSON response
+            Parsed JSON response or raw text if raw=True
         """
-        url = Operaton._get_base_url() + "/" + path.lstrip("/")
-        request = js.XMLHttpRequest.new()
-        request.open("PUT", url, False)
-        request.setRequestHeader("Content-Type", "application/json")
-        request.setRequestHeader("X-XSRF-TOKEN", Operaton._get_csrf_token())
-        request.send(json.dumps(data))
-        assert request.status in [200, 204], request.responseText
-        return json.loads(request.responseText or 'null')
+        return Operaton._request(
+            "PUT", path, [200, 204], data=data, headers=_json_headers_js, raw=raw
+        )
 
     @staticmethod
     def delete(path, raw=False):
@@ -361,21 +727,146 @@ class Operaton:
         Returns:
             Parsed JSON response or raw text if raw=True
         """
-        url = Operaton._get_base_url() + "/" + path.lstrip("/")
-        request = js.XMLHttpRequest.new()
-        request.open("DELETE", url, False)
-        request.setRequestHeader("X-XSRF-TOKEN", Operaton._get_csrf_token())
-        request.send(None)
-        assert request.status in [204], request.responseText
-        return request.responseText if raw else json.loads(request.responseText or 'null')
+        return Operaton._request("DELETE", path, [204], headers=_csrf_headers_js, raw=raw)
+
+    @staticmethod
+    async def _fetch_async(
+        method, path, statuses, data=_NO_BODY, headers=None, raw=False, cache=True,
+    ):
+        """Make a non-blocking request to the Operaton REST API using fetch()."""
+        url = Operaton._url(path)
+        text = _cached_get(url) if cache and method == "GET" else None
+        if text is None:
+            kwargs = {"method": method}
+            if headers:
+                kwargs["headers"] = headers
+            if data is not _NO_BODY:
+                kwargs["body"] = Operaton._body(data)
+            response = await pyfetch(url, **kwargs)
+            text = await response.text()
+            Operaton._update_cache(method, url, response.status in statuses, text)
+            assert response.status in statuses, text
+        return text if raw else json.loads(text or 'null')
+
+    @staticmethod
+    async def get_async(path, raw=False, cache=True):
+        """
+        Make a non-blocking GET request to the Operaton REST API.
+        
+        Args:
+            path: API path (e.g., '/process-definition')
+            raw: If True, return raw response text instead of parsing JSON
+            cache: If False, always request a fresh response (e.g. when polling)
+            
+        Returns:
+            Parsed JSON response or raw text if raw=True
+        """
+        return await Operaton._fetch_async("GET", path, [200], raw=raw, cache=cache)
+
+    @staticmethod
+    async def get_many(paths, raw=False, cache=True):
+        """
+        Make several non-blocking GET requests to the Operaton REST API concurrently.
+        
+        Args:
+            paths: API paths to fetch
+            raw: If True, return raw response texts instead of parsing JSON
+            cache: If False, always request fresh responses
+            
+        Returns:
+            List of parsed JSON responses (or raw texts), in the order of paths
+        """
+        return await asyncio.gather(*[Operaton.get_async(path, raw=raw, cache=cache) for path in paths])
+
+    @staticmethod
+    async def post_async(path, data, raw=False):
+        """
+        Make a non-blocking POST request to the Operaton REST API.
+        
+        Args:
+            path: API path
+            data: Data to send as JSON (str or bytes are sent as-is)
+            raw: If True, return raw response text instead of parsing JSON
+            
+        Returns:
+            Parsed JSON response or raw text if raw=True
+        """
+        return await Operaton._fetch_async(
+            "POST", path, [200, 204], data=data, headers=_json_headers, raw=raw,
+        )
+
+    @staticmethod
+    async def put_async(path, data, raw=False):
+        """
+        Make a non-blocking PUT request to the Operaton REST API.
+        
+        Args:
+            path: API path
+            data: Data to send as JSON (str or bytes are sent as-is)
+            raw: If True, return raw response text instead of parsing JSON
+            
+        Returns:
+            Parsed JSON response or raw text if raw=True
+        """
+        return await Operaton._fetch_async(
+            "PUT", path, [200, 204], data=data, headers=_json_headers, raw=raw,
+        )
+
+    @staticmethod
+    async def delete_async(path, raw=False):
+        """
+        Make a non-blocking DELETE request to the Operaton REST API.
+        
+        Args:
+            path: API path
+            raw: If True, return raw response text instead of parsing JSON
+            
+        Returns:
+            Parsed JSON response or raw text if raw=True
+        """
+        return await Operaton._fetch_async(
+            "DELETE", path, [204], headers=_csrf_headers, raw=raw,
+        )
+
+
+# =============================================================================
+# Moddle Helpers
+# =============================================================================
+
+# Reusable toXML() options objects, by format_output value
+_xml_options = {}
+
+
+def _get_xml_options(format_output: bool):
+    """Get the toXML() options object for the given formatting choice."""
+    format_output = bool(format_output)
+    options = _xml_options.get(format_output)
+    if options is None:
+        options = js.Object.new()
+        options.format = format_output
+        _xml_options[format_output] = options
+    return options
 
 
 # =============================================================================
 # BPMN Moddle
 # =============================================================================
 
-# Track if bpmn-moddle has been loaded
-_bpmn_moddle_loaded = False
+# Shared BpmnModdle instance (with Camunda extensions)
+_bpmn_moddle_instance = None
+
+
+async def _get_bpmn_moddle():
+    """
+    Get the shared BpmnModdle instance.
+    
+    Loads bpmn-moddle if needed and creates the instance on first use.
+    """
+    global _bpmn_moddle_instance
+    if _bpmn_moddle_instance is None:
+        await load_bpmn_moddle()
+        _bpmn_moddle_instance = js.createBpmnModdle()
+    return _bpmn_moddle_instance
 
 
 async def load_bpmn_moddle():
@@ -390,50 +881,22 @@ async def load_bpmn_moddle():
     Returns:
         The BpmnModdle constructor function
     """
-    global _bpmn_moddle_loaded
-    
-    if _bpmn_moddle_loaded:
-        return getattr(js, 'BpmnModdle', None)
-    
-    # Check if already loaded
-    if hasattr(js, 'BpmnModdle'):
-        _bpmn_moddle_loaded = True
-        return js.BpmnModdle
-    
-    # Get the bundle via BroadcastChannel
-    bridge = get_bridge()
-    bundle_code = await bridge.get_bpmn_moddle_bundle()
-    
-    if not bundle_code:
-        raise ImportError("Failed to get bpmn-moddle bundle from extension")
-    
-    # The webpack bundle uses an internal module system that expects 'exports' to exist.
-    # We need to wrap the bundle in a function that provides these globals.
-    # The bundle ends with: self.BpmnModdle = ...
-    wrapper_code = f"""
-(function() {{
-    {bundle_code}
-}})();
-"""
-    js.eval(wrapper_code)
-    
-    if hasattr(js, 'BpmnModdle'):
-        _bpmn_moddle_loaded = True
-        if DEBUG():
-            print("bpmn-moddle: Loaded successfully via BroadcastChannel (with Camunda extensions)")
-        return js.BpmnModdle
-    else:
-        raise ImportError("BpmnModdle not found after evaluating bundle")
+    # The bundle assigns its exports to globals, e.g. self.BpmnModdle = ...
+    return await _load_library('bpmn-moddle')
 
 
-async def parse_bpmn(xml_string: str):
+async def parse_bpmn(xml_string: str, root_type: str | None = None, lax: bool | None = None):
     """
     Parse a BPMN 2.0 XML string.
     
-    The BpmnModdle instance is automatically configured with Camunda extensions.
+    The shared BpmnModdle instance is automatically configured with Camunda extensions.
     
     Args:
         xml_string: The BPMN XML content to parse
+        root_type: The expected root element type (default: 'bpmn:Definitions');
+            pass e.g. 'bpmn:Process' to parse a fragment directly
+        lax: If set, whether the reader tolerates unknown elements and attributes
+            (reporting them as warnings) instead of failing on them
         
     Returns:
         A JavaScript object containing:
@@ -443,12 +906,55 @@ async def parse_bpmn(xml_string: str):
         - warnings: Array of parsing warnings
     """
     # Use createBpmnModdle which includes Camunda extensions
-    if not hasattr(js, 'createBpmnModdle'):
-        await load_bpmn_moddle()
+    moddle = await _get_bpmn_moddle()
+    if root_type is None and lax is None:
+        return await moddle.fromXML(xml_string)
     
-    moddle = js.createBpmnModdle()
-    result = await moddle.fromXML(xml_string)
-    return result
+    options = js.Object.new()
+    if lax is not None:
+        options.lax = lax
+    return await moddle.fromXML(xml_string, root_type or 'bpmn:Definitions', options)
+
+
+# Extracts the commonly used fields of a parse result in a single JS pass
+_SUMMARIZE_BPMN_JS = """
+return {
+    id: result.rootElement.id,
+    rootType: result.rootElement.$type,
+    elementCount: Object.keys(result.elementsById).length,
+    referenceCount: result.references.length,
+    warnings: result.warnings.map((warning) => warning.message),
+};
+"""
+
+# Compiled summary function, created on first use
+_summarize_bpmn_result = None
+
+
+async def parse_bpmn_summary(xml_string: str) -> dict:
+    """
+    Parse a BPMN 2.0 XML string and return a compact summary.
+    
+    Use this instead of converting the full parse result with to_py() when
+    only summary data is needed; just the small summary object is converted.
+    
+    Args:
+        xml_string: The BPMN XML content to parse
+        
+    Returns:
+        A dict containing:
+        - id: The ID of the root element
+        - rootType: The type of the root element (e.g., 'bpmn:Definitions')
+        - elementCount: Number of elements with an ID
+        - referenceCount: Number of references
+        - warnings: List of parsing warning messages
+    """
+    global _summarize_bpmn_result
+    
+    result = await parse_bpmn(xml_string)
+    if _summarize_bpmn_result is None:
+        _summarize_bpmn_result = js.Function.new('result', _SUMMARIZE_BPMN_JS)
+    return _summarize_bpmn_result(result).to_py()
 
 
 async def to_bpmn_xml(element, format_output=True):
@@ -462,16 +968,32 @@ async def to_bpmn_xml(element, format_output=True):
     Returns:
         The BPMN XML string
     """
-    if not hasattr(js, 'createBpmnModdle'):
-        await load_bpmn_moddle()
-    
-    moddle = js.createBpmnModdle()
-    options = js.Object.new()
-    options.format = format_output
+    moddle = await _get_bpmn_moddle()
+    options = _get_xml_options(format_output)
     result = await moddle.toXML(element, options)
     return result.xml
 
 
+async def to_bpmn_xml_many(elements, format_output=True) -> list[str]:
+    """
+    Convert several BPMN elements to XML strings concurrently.
+    
+    All serializations are started at once on the shared moddle instance
+    and awaited together, instead of one after another.
+    
+    Args:
+        elements: The BPMN elements to serialize
+        format_output: Whether to format the output with indentation
+        
+    Returns:
+        The BPMN XML strings, in the order of the given elements
+    """
+    moddle = await _get_bpmn_moddle()
+    options = _get_xml_options(format_output)
+    results = await asyncio.gather(*[moddle.toXML(element, options) for element in elements])
+    return [result.xml for result in results]
+
+
 async def create_bpmn_element(element_type: str, **attrs):
     """
     Create a new BPMN element.
@@ -483,13 +1005,8 @@ async def create_bpmn_element(element_type: str, **attrs):
     Returns:
         A new BPMN element
     """
-    if not hasattr(js, 'createBpmnModdle'):
-        await load_bpmn_moddle()
-    
-    moddle = js.createBpmnModdle()
-    js_attrs = js.Object.new()
-    for key, value in attrs.items():
-        setattr(js_attrs, key, value)
+    moddle = await _get_bpmn_moddle()
+    js_attrs = to_js(attrs, dict_converter=js.Object.fromEntries)
     return moddle.create(element_type, js_attrs)
 
 
@@ -497,8 +1014,21 @@ async def create_bpmn_element(element_type: str, **attrs):
 # DMN Moddle
 # =============================================================================
 
-# Track if dmn-moddle has been loaded
-_dmn_moddle_loaded = False
+# Shared DmnModdle instance (with Camunda extensions)
+_dmn_moddle_instance = None
+
+
+async def _get_dmn_moddle():
+    """
+    Get the shared DmnModdle instance.
+    
+    Loads dmn-moddle if needed and creates the instance on first use.
+    """
+    global _dmn_moddle_instance
+    if _dmn_moddle_instance is None:
+        await load_dmn_moddle()
+        _dmn_moddle_instance = js.createDmnModdle()
+    return _dmn_moddle_instance
 
 
 async def load_dmn_moddle():
@@ -513,53 +1043,22 @@ async def load_dmn_moddle():
     Returns:
         The DmnModdle constructor function
     """
-    global _dmn_moddle_loaded
-    
-    if _dmn_moddle_loaded:
-        return getattr(js, 'DmnModdle', None)
-    
-    # Check if already loaded
-    if hasattr(js, 'DmnModdle'):
-        _dmn_moddle_loaded = True
-        return js.DmnModdle
-    
-    # Get the bundle via BroadcastChannel
-    bridge = get_bridge()
-    
-    # Request DMN moddle bundle
-    response = await bridge.request('get_dmn_moddle_bundle')
-    bundle_code = response.get('bundle', '')
-    
-    if not bundle_code:
-        raise ImportError("Failed to get dmn-moddle bundle from extension")
-    
-    # The webpack bundle uses an internal module system that expects 'exports' to exist.
-    # We need to wrap the bundle in a function that provides these globals.
-    # The bundle ends with: self.DmnModdle = ...
-    wrapper_code = f"""
-(function() {{
-    {bundle_code}
-}})();
-"""
-    js.eval(wrapper_code)
-    
-    if hasattr(js, 'DmnModdle'):
-        _dmn_moddle_loaded = True
-        if DEBUG():
-            print("dmn-moddle: Loaded successfully via BroadcastChannel")
-        return js.DmnModdle
-    else:
-        raise ImportError("DmnModdle not found after evaluating bundle")
+    # The bundle assigns its exports to globals, e.g. self.DmnModdle = ...
+    return await _load_library('dmn-moddle')
 
 
-async def parse_dmn(xml_string: str):
+async def parse_dmn(xml_string: str, root_type: str | None = None, lax: bool | None = None):
     """
     Parse a DMN 1.3 XML string.
     
-    The DmnModdle instance is automatically configured with Camunda extensions.
+    The shared DmnModdle instance is automatically configured with Camunda extensions.
     
     Args:
         xml_string: The DMN XML content to parse
+        root_type: The expected root element type (default: 'dmn:Definitions');
+            pass e.g. 'dmn:Decision' to parse a fragment directly
+        lax: If set, whether the reader tolerates unknown elements and attributes
+            (reporting them as warnings) instead of failing on them
         
     Returns:
         A JavaScript object containing:
@@ -569,12 +1068,14 @@ async def parse_dmn(xml_string: str):
         - warnings: Array of parsing warnings
     """
     # Use createDmnModdle which includes Camunda extensions
-    if not hasattr(js, 'createDmnModdle'):
-        await load_dmn_moddle()
+    moddle = await _get_dmn_moddle()
+    if root_type is None and lax is None:
+        return await moddle.fromXML(xml_string)
     
-    moddle = js.createDmnModdle()
-    result = await moddle.fromXML(xml_string)
-    return result
+    options = js.Object.new()
+    if lax is not None:
+        options.lax = lax
+    return await moddle.fromXML(xml_string, root_type or 'dmn:Definitions', options)
 
 
 async def to_dmn_xml(element, format_output=True):
@@ -588,16 +1089,32 @@ async def to_dmn_xml(element, format_output=True):
     Returns:
         The DMN XML string
     """
-    if not hasattr(js, 'createDmnModdle'):
-        await load_dmn_moddle()
-    
-    moddle = js.createDmnModdle()
-    options = js.Object.new()
-    options.format = format_output
+    moddle = await _get_dmn_moddle()
+    options = _get_xml_options(format_output)
     result = await moddle.toXML(element, options)
     return result.xml
 
 
+async def to_dmn_xml_many(elements, format_output=True) -> list[str]:
+    """
+    Convert several DMN elements to XML strings concurrently.
+    
+    All serializations are started at once on the shared moddle instance
+    and awaited together, instead of one after another.
+    
+    Args:
+        elements: The DMN elements to serialize
+        format_output: Whether to format the output with indentation
+        
+    Returns:
+        The DMN XML strings, in the order of the given elements
+    """
+    moddle = await _get_dmn_moddle()
+    options = _get_xml_options(format_output)
+    results = await asyncio.gather(*[moddle.toXML(element, options) for element in elements])
+    return [result.xml for result in results]
+
+
 async def create_dmn_element(element_type: str, **attrs):
     """
     Create a new DMN element.
@@ -609,13 +1126,8 @@ async def create_dmn_element(element_type: str, **attrs):
     Returns:
         A new DMN element
     """
-    if not hasattr(js, 'createDmnModdle'):
-        await load_dmn_moddle()
-    
-    moddle = js.createDmnModdle()
-    js_attrs = js.Object.new()
-    for key, value in attrs.items():
-        setattr(js_attrs, key, value)
+    moddle = await _get_dmn_moddle()
+    js_attrs = to_js(attrs, dict_converter=js.Object.fromEntries)
     return moddle.create(element_type, js_attrs)
 
 
@@ -623,9 +1135,6 @@ async def create_dmn_element(element_type: str, **attrs):
 # BPMN-JS-Differ
 # =============================================================================
 
-# Track if bpmn-js-differ has been loaded
-_bpmn_js_differ_loaded = False
-
 
 async def load_bpmn_js_differ():
     """
@@ -637,41 +1146,8 @@ async def load_bpmn_js_differ():
     Returns:
         The bpmnDiff function
     """
-    global _bpmn_js_differ_loaded
-    
-    if _bpmn_js_differ_loaded:
-        return getattr(js, 'bpmnDiff', None)
-    
-    # Check if already loaded
-    if hasattr(js, 'bpmnDiff'):
-        _bpmn_js_differ_loaded = True
-        return js.bpmnDiff
-    
-    # Get the bundle via BroadcastChannel
-    bridge = get_bridge()
-    response = await bridge.request('get_bpmn_js_differ_bundle')
-    bundle_code = response.get('bundle', '')
-    
-    if not bundle_code:
-        raise ImportError("Failed to get bpmn-js-differ bundle from extension")
-    
-    # The webpack bundle uses an internal module system that expects 'exports' to exist.
-    # We need to wrap the bundle in a function that provides these globals.
-    # The bundle ends with: self.bpmnDiff = ...
-    wrapper_code = f"""
-(function() {{
-    {bundle_code}
-}})();
-"""
-    js.eval(wrapper_code)
-    
-    if hasattr(js, 'bpmnDiff'):
-        _bpmn_js_differ_loaded = True
-        if DEBUG():
-            print("bpmn-js-differ: Loaded successfully via BroadcastChannel")
-        return js.bpmnDiff
-    else:
-        raise ImportError("bpmnDiff not found after evaluating bundle")
+    # The bundle assigns its exports to globals, e.g. self.bpmnDiff = ...
+    return await _load_library('bpmn-js-differ')
 
 
 def diff_bpmn(old_definitions, new_definitions):
@@ -695,7 +1171,7 @@ def diff_bpmn(old_definitions, new_definitions):
         - changed: Array of changed element IDs
         - layoutChanged: Array of layout-changed element IDs
     """
-    if not hasattr(js, 'bpmnDiff'):
+    if not _library_loaded('bpmn-js-differ'):
         raise RuntimeError("bpmn-js-differ not loaded. Call await load_bpmn_js_differ() first.")
     
     return js.bpmnDiff(old_definitions, new_definitions)
@@ -716,63 +1192,70 @@ class BpmnDiffResult:
             js_diff_result: The result from diff_bpmn()
         """
         self._result = js_diff_result
+        # Convert each map once; the properties below return these dicts
+        self._added = self._map_to_dict(js_diff_result._added)
+        self._removed = self._map_to_dict(js_diff_result._removed)
+        self._changed = self._map_to_dict(js_diff_result._changed)
+        self._layout_changed = self._map_to_dict(js_diff_result._layoutChanged)
     
     @property
     def added(self) -> dict:
         """Elements that were added in the new diagram."""
-        return self._map_to_dict(self._result._added)
+        return self._added
     
     @property
     def removed(self) -> dict:
         """Elements that were removed from the old diagram."""
-        return self._map_to_dict(self._result._removed)
+        return self._removed
     
     @property
     def changed(self) -> dict:
         """Elements that were modified (attributes changed)."""
-        return self._map_to_dict(self._result._changed)
+        return self._changed
     
     @property
     def layout_changed(self) -> dict:
         """Elements with layout changes only (position/size)."""
-        return self._map_to_dict(self._result._layoutChanged)
+        return self._layout_changed
     
     @property
     def added_ids(self) -> list:
         """List of IDs of added elements."""
-        return list(self.added.keys())
+        return list(self._added.keys())
     
     @property
     def removed_ids(self) -> list:
         """List of IDs of removed elements."""
-        return list(self.removed.keys())
+        return list(self._removed.keys())
     
     @property
     def changed_ids(self) -> list:
         """List of IDs of changed elements."""
-        return list(self.changed.keys())
+        return list(self._changed.keys())
     
     @property
     def layout_changed_ids(self) -> list:
         """List of IDs of elements with layout changes."""
-        return list(self.layout_changed.keys())
+        return list(self._layout_changed.keys())
     
     @property
     def has_changes(self) -> bool:
         """Whether there are any changes between the two diagrams."""
-        return bool(self.added or self.removed or self.changed or self.layout_changed)
+        return bool(self._added or self._removed or self._changed or self._layout_changed)
     
-    def _map_to_dict(self, js_map) -> dict:
+    @staticmethod
+    def _map_to_dict(js_map) -> dict:
         """Convert a JavaScript Map-like object to a Python dict."""
         if js_map is None:
             return {}
         try:
-            # The _added, _removed, etc. are JavaScript objects, not Maps
-            result = {}
-            keys = list(js.Object.keys(js_map))
-            for key in keys:
-                result[str(key)] = getattr(js_map, str(key))
-            return result
+            # The _added, _removed, etc. are plain JavaScript objects, not Maps.
+            # Convert the top level only, keeping values as proxies.
+            result = js_map.to_py(depth=1)
+            if isinstance(result, dict):
+                return result
+            # Objects that are not plain objects are returned unconverted
+            return dict(js.Object.entries(js_map).to_py(depth=2))
         except Exception:
             return {}
     
@@ -790,6 +1273,8 @@ async def compare_bpmn(old_xml: str, new_xml: str) -> BpmnDiffResult:
     This is a convenience function that handles loading the required libraries
     and parsing the XML before computing the diff.
     
+    The diff runs in the Pyodide worker, not on the JupyterLab UI thread.
+    
     Args:
         old_xml: The old BPMN XML string
         new_xml: The new BPMN XML string
@@ -804,13 +1289,13 @@ async def compare_bpmn(old_xml: str, new_xml: str) -> BpmnDiffResult:
             print(f"Removed elements: {result.removed_ids}")
             print(f"Changed elements: {result.changed_ids}")
     """
-    # Ensure both libraries are loaded
-    await load_bpmn_moddle()
-    await load_bpmn_js_differ()
+    # Ensure both libraries are loaded (their bundles are fetched concurrently)
+    await asyncio.gather(load_bpmn_moddle(), load_bpmn_js_differ())
     
     # Parse both diagrams
-    old_result = await parse_bpmn(old_xml)
-    new_result = await parse_bpmn(new_xml)
+    old_result, new_result = await asyncio.gather(
+        parse_bpmn(old_xml), parse_bpmn(new_xml)
+    )
     
     # Compute the diff
     js_diff = diff_bpmn(old_result.rootElement, new_result.rootElement)
@@ -845,10 +1330,50 @@ def compare_bpmn_definitions(old_definitions, new_definitions) -> BpmnDiffResult
             new_result.rootElement
         )
     """
-    if not hasattr(js, 'bpmnDiff'):
+    if not _library_loaded('bpmn-js-differ'):
         raise RuntimeError(
             "bpmn-js-differ not loaded. Call await operaton.load_bpmn_js_differ() first."
         )
     
     js_diff = diff_bpmn(old_definitions, new_definitions)
     return BpmnDiffResult(js_diff)
+
+
+# =============================================================================
+# Prefetching
+# =============================================================================
+
+async def preload_bundles(names: list[str]):
+    """
+    Load several JavaScript libraries concurrently.
+    
+    The bundle requests are issued in the same event loop tick, so they are
+    sent to the extension as a single batch:
+        await operaton.preload_bundles(['bpmn-moddle', 'bpmn-js-differ'])
+    
+    Args:
+        names: Bundle names ('bpmn-moddle', 'dmn-moddle', 'bpmn-js-differ')
+    """
+    await asyncio.gather(*_start_libraries(names))
+
+
+def _start_libraries(names: list[str]) -> list:
+    """Start loading several libraries, returning a shielded future for each."""
+    unknown = [name for name in names if name not in _LIBRARY_GLOBALS]
+    if unknown:
+        raise ValueError(f"Unknown bundle(s): {', '.join(unknown)}")
+    return [asyncio.shield(_start_library(name)) for name in names]
+
+
+async def prefetch_all():
+    """
+    Load the environment and all JavaScript libraries concurrently.
+    
+    The bridge requests are issued in the same event loop tick, so they are
+    sent to the extension as a single batch instead of one round-trip each:
+        await operaton.prefetch_all()
+    """
+    # The library loads are started first: they send their requests in the
+    # next tick, together with the environment request of the gather() task
+    libraries = _start_libraries(list(_LIBRARY_GLOBALS))
+    await asyncio.gather(_load_env_async(), *libraries)
@@ -2,18 +2,35 @@
 
 This addon patches the JupyterLite index.html files to listen for environment
 data from the parent Operaton Cockpit window and store it in localStorage.
-The communication uses the postMessage API.
+The communication uses the postMessage API. In the apps running notebooks,
+the patch also prefetches the JavaScript library bundles served by the
+extension.
 """
 
+import hashlib
+import re
+
+import doit.tools
 from jupyterlite_core.addons.base import BaseAddon
 
 PATCH = """
+        // Environment variable names for the keys sent by Operaton Plugin API
+        const OPERATON_ENV_KEYS = {
+          adminApi: 'OPERATON_ADMIN_API',
+          baseApi: 'OPERATON_BASE_API',
+          engineApi: 'OPERATON_ENGINE_API',
+          engine: 'OPERATON_ENGINE',
+          tasklistApi: 'OPERATON_TASKLIST_API',
+          CSRFToken: 'OPERATON_CSRF_TOKEN',
+        };
         // Capture and save Operaton API information sent by Operaton Plugin API
         window.addEventListener('message', function(ev) {
           if (window.location.toString().startsWith(ev.origin)) {
             const env = {};
             for (const key of Object.keys(ev.data)) {
-              env['OPERATON_' + key.replace('Api', '_API').replace('Token', '_TOKEN').toUpperCase()] = key.endsWith('Api') ? ev.origin + ev.data[key] : ev.data[key];
+              // Derive names for keys unknown to this version
+              const name = Object.hasOwn(OPERATON_ENV_KEYS, key) ? OPERATON_ENV_KEYS[key] : 'OPERATON_' + key.replace('Api', '_API').replace('Token', '_TOKEN').toUpperCase();
+              env[name] = key.endsWith('Api') ? ev.origin + ev.data[key] : ev.data[key];
             }
             window.localStorage.setItem('env', JSON.stringify(env));
           }
@@ -21,6 +38,41 @@ PATCH = """
         window.parent.postMessage('ready');
 """
 
+# Apps whose kernels load the library bundles
+PREFETCH_APPS = ("lab", "notebooks")
+
+# Library bundles, in the order build:config hashes them into the BUILD_ID
+BUNDLE_FILES = ("bpmn-moddle.umd.js", "dmn-moddle.umd.js", "bpmn-js-differ.umd.js")
+
+# Where the extension serves the bundles from, relative to the base URL
+STATIC_PATH = "extensions/@operaton/operaton-extension/static"
+
+PREFETCH_PATCH = """
+        // Let the browser fetch the library bundles while Pyodide is starting,
+        // unless the extension already keeps them in its Cache Storage
+        (async function () {
+          const cacheName = 'operaton-bundles-BUILD_ID';
+          if (typeof caches !== 'undefined' && await caches.has(cacheName).catch(() => false)) {
+            return;
+          }
+          // Use the same base URL as the extension (PageConfig.getBaseUrl())
+          const config = JSON.parse(document.getElementById('jupyter-config-data').textContent);
+          const baseUrl = (config.baseUrl || '/').replace(/\\/$/, '');
+          for (const file of BUNDLE_FILES) {
+            const link = document.createElement('link');
+            link.rel = 'prefetch';
+            link.href = baseUrl + '/STATIC_PATH/' + file;
+            document.head.appendChild(link);
+          }
+        })();
+"""
+
+# Patches are marked, so that an outdated patch can be replaced
+PATCH_RE = re.compile(rb"\n *// operaton-patch:begin.*?// operaton-patch:end\n", re.DOTALL)
+
+# The patch goes right after the first statement loading config-utils.js
+ANCHOR_RE = re.compile(rb"config-utils\.js.*?\);", re.DOTALL)
+
 
 class OperatonAddon(BaseAddon):
     """Patch index.html for Operaton plugin."""
@@ -35,25 +87,72 @@ class OperatonAddon(BaseAddon):
     def post_build(self, manager):
         """Yield doit tasks to patch index.html files."""
         paths = list(manager.output_dir.glob("*/index.html"))
+        bundles = [manager.output_dir / STATIC_PATH / name for name in BUNDLE_FILES]
         yield dict(
             name="patch:index.html",
             doc="ensure index.html has Operaton patch",
-            file_dep=[*paths],
+            file_dep=[*paths, *[bundle for bundle in bundles if bundle.exists()]],
             actions=[(self.patch, [paths])],
-            targets=[*[f"{path}#operaton" for path in paths]],
+            targets=[self.stamp_path(path) for path in paths],
+            uptodate=[doit.tools.config_changed(dict(patch=PATCH, prefetch=PREFETCH_PATCH))],
         )
 
+    def build_id(self):
+        """Return the BUILD_ID of the deployed bundles, or None if any is missing."""
+        digest = hashlib.sha256()
+        for name in BUNDLE_FILES:
+            bundle = self.manager.output_dir / STATIC_PATH / name
+            if not bundle.exists():
+                return None
+            digest.update(bundle.read_bytes())
+        return digest.hexdigest()[:16]
+
+    @staticmethod
+    def patch_bytes(path, build_id):
+        """Return the marked patch for an app's index.html."""
+        patch = PATCH
+        if build_id and path.parent.name in PREFETCH_APPS:
+            patch += (
+                PREFETCH_PATCH.replace("BUILD_ID", build_id)
+                .replace("BUNDLE_FILES", repr(list(BUNDLE_FILES)))
+                .replace("STATIC_PATH", STATIC_PATH)
+            )
+        marked = "\n        // operaton-patch:begin" + patch + "        // operaton-patch:end\n"
+        return marked.encode()
+
+    def stamp_path(self, path):
+        """Return the stamp file, in the build cache, marking index.html as patched."""
+        return self.manager.cache_dir / "operaton" / f"{path.parent.name}-index.html.stamp"
+
     def patch(self, paths):
         """Patch index.html for Operaton plugin."""
+        build_id = self.build_id()
         for path in paths:
-            index_html = path.read_text()
-            if PATCH in index_html:
+            patch_bytes = self.patch_bytes(path, build_id)
+            patch_hash = hashlib.sha1(patch_bytes).hexdigest()
+            stamp = self.stamp_path(path)
+            # Skip reading files not modified since they were last patched
+            # with the current patch, whose hash the stamp records
+            if (
+                stamp.exists()
+                and stamp.stat().st_mtime >= path.stat().st_mtime
+                and stamp.read_text() == patch_hash
+            ):
                 continue
-            # Find the location after config-utils.js is loaded
-            match = index_html.find("config-utils.js")
-            match = match + index_html[match:].find(");") if match > -1 else -1
-            if match > -1:
-                match += len(");")
-                path.write_text(
-                    index_html[0:match] + PATCH + index_html[match:]
-                )
+            index_html = path.read_bytes()
+            if patch_bytes not in index_html:
+                match = PATCH_RE.search(index_html)
+                if match:
+                    # Replace an outdated patch
+                    start, end = match.span()
+                    index_html = index_html[:start] + patch_bytes + index_html[end:]
+                else:
+                    # Find the location after config-utils.js is loaded
+                    match = ANCHOR_RE.search(index_html)
+                    if not match:
+                        continue
+                    end = match.end()
+                    index_html = index_html[:end] + patch_bytes + index_html[end:]
+                path.write_bytes(index_html)
+            stamp.parent.mkdir(parents=True, exist_ok=True)
+            stamp.write_text(patch_hash)
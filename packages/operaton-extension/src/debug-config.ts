@@ -1 +1,2 @@
 export const DEBUG_BUILD = false;
+export const BUILD_ID = 'f13484ece3eacf21';
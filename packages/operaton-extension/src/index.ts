@@ -10,9 +10,9 @@
  * - Other main window resources
  * 
  * Usage from Python:
- *     from bpmn_moddle import load_bpmn_moddle, parse_bpmn
- *     await load_bpmn_moddle()
- *     result = await parse_bpmn(bpmn_xml)
+ *     import operaton
+ *     await operaton.load_bpmn_moddle()
+ *     result = await operaton.parse_bpmn(bpmn_xml)
  */
 
 import {
@@ -22,7 +22,7 @@ import {
 
 import { PageConfig } from '@jupyterlab/coreutils';
 
-import { DEBUG_BUILD } from './debug-config';
+import { BUILD_ID, DEBUG_BUILD } from './debug-config';
 
 /**
  * Debug flag - set to true to enable verbose logging.
@@ -132,14 +132,147 @@ async function getBpmnJsDifferBundle(): Promise<string> {
 }
 
 /**
- * Handle messages from workers via BroadcastChannel
+ * Get the version of a localStorage value
+ * 
+ * The version is a hash of the value, so every window on the origin
+ * (each answering on the same BroadcastChannel) reports the same version
+ * for the same value, and the version changes whenever the value does.
+ * Missing values have a null version.
  */
-async function handleMessage(
-  data: Record<string, unknown>,
-  channel: BroadcastChannel
-): Promise<void> {
+function getLocalStorageVersion(key: string): string | null {
+  const value = localStorage.getItem(key);
+  if (value === null) {
+    return null;
+  }
+  // 32-bit FNV-1a, combined with the length to make collisions even less likely
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < value.length; i++) {
+    hash ^= value.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return `${value.length.toString(16)}-${(hash >>> 0).toString(16)}`;
+}
+
+// Bundle static asset filenames, by bundle name
+const bundleFiles: Record<string, string> = {
+  'bpmn-moddle': 'bpmn-moddle.umd.js',
+  'dmn-moddle': 'dmn-moddle.umd.js',
+  'bpmn-js-differ': 'bpmn-js-differ.umd.js',
+};
+
+// Cache for bundle Blob URLs, by bundle name
+const bundleUrlCache: Record<string, Promise<string>> = {};
+
+// Cache Storage name prefix for bundles; the build ID, a hash of the bundles,
+// keeps each set of bundles apart (the addon's index.html patch checks for
+// this cache before prefetching the bundles)
+const BUNDLE_CACHE_PREFIX = 'operaton-bundles-';
+
+let bundleCachePromise: Promise<Cache | null> | null = null;
+
+/**
+ * Open the Cache Storage for bundles of this build
+ * 
+ * Caches of previous builds are deleted. Resolves to null when Cache
+ * Storage is not available (e.g. insecure contexts) or there is no
+ * build ID.
+ */
+function openBundleCache(): Promise<Cache | null> {
+  if (!bundleCachePromise) {
+    bundleCachePromise = (async () => {
+      if (!BUILD_ID || typeof caches === 'undefined') {
+        return null;
+      }
+      try {
+        const name = `${BUNDLE_CACHE_PREFIX}${BUILD_ID}`;
+        for (const key of await caches.keys()) {
+          if (key.startsWith(BUNDLE_CACHE_PREFIX) && key !== name) {
+            await caches.delete(key);
+          }
+        }
+        return await caches.open(name);
+      } catch (error) {
+        if (DEBUG()) console.log('operaton-bridge: Bundle cache unavailable:', error);
+        return null;
+      }
+    })();
+  }
+  return bundleCachePromise;
+}
+
+/**
+ * Fetch a bundle, preferring the bundle cache of this build
+ * 
+ * Bundles are immutable per build, so a cached copy is used without
+ * revalidating it against the server on later page loads.
+ */
+async function fetchBundleBlob(name: string, bundleUrl: string): Promise<Blob> {
+  const cache = await openBundleCache();
+  const cached = cache ? await cache.match(bundleUrl) : undefined;
+  if (cached) {
+    if (DEBUG()) console.log('operaton-bridge: Using cached', name, 'bundle');
+    return cached.blob();
+  }
+  
+  if (DEBUG()) console.log('operaton-bridge: Fetching', name, 'bundle from', bundleUrl);
+  const response = await fetch(bundleUrl);
+  if (!response.ok) {
+    throw new Error(`Failed to fetch ${name} bundle: ${response.status} ${response.statusText}`);
+  }
+  if (cache) {
+    try {
+      await cache.put(bundleUrl, response.clone());
+    } catch (error) {
+      if (DEBUG()) console.log('operaton-bridge: Could not cache', name, 'bundle:', error);
+    }
+  }
+  return response.blob();
+}
+
+/**
+ * Fetch a bundle into a Blob URL
+ * 
+ * The response is kept as a Blob, so the bundle is never decoded into a
+ * string (and re-encoded) in the main window.
+ */
+async function fetchBundleUrl(name: string): Promise<string> {
+  const filename = bundleFiles[name];
+  if (!filename) {
+    throw new Error(`Unknown bundle: ${name}`);
+  }
+  
+  const bundleUrl = getExtensionStaticUrl(filename);
+  const blob = new Blob([await fetchBundleBlob(name, bundleUrl)], { type: 'text/javascript' });
+  const url = URL.createObjectURL(blob);
+  if (DEBUG()) console.log('operaton-bridge:', name, 'bundle URL cached', url, blob.size, 'bytes');
+  return url;
+}
+
+/**
+ * Get a Blob URL for a bundle and cache it
+ * 
+ * Workers fetch the bundle from the Blob URL themselves, so only the
+ * short URL needs to be copied over the BroadcastChannel. Concurrent
+ * requests for the same bundle share a single fetch.
+ */
+function getBundleUrl(name: string): Promise<string> {
+  if (!(name in bundleUrlCache)) {
+    bundleUrlCache[name] = fetchBundleUrl(name).catch((error) => {
+      delete bundleUrlCache[name];
+      throw error;
+    });
+  }
+  return bundleUrlCache[name];
+}
+
+/**
+ * Dispatch a single request and build its response
+ */
+async function dispatchRequest(
+  data: Record<string, unknown>
+): Promise<Record<string, unknown>> {
   const action = data.action as string;
-  const requestId = data.request_id as string;
+  const requestId = data.request_id as number | string;
   
   if (DEBUG()) console.log('operaton-bridge: Received:', action, requestId);
   
@@ -165,10 +298,25 @@ async function handleMessage(
         break;
       }
       
+      case 'get_bundle_url': {
+        const name = data.name as string;
+        const url = await getBundleUrl(name);
+        response = { action: 'bundle_url', request_id: requestId, name, url };
+        break;
+      }
+      
       case 'get_localstorage': {
         const key = data.key as string;
         const value = localStorage.getItem(key);
-        response = { action: 'localstorage_value', request_id: requestId, key, value };
+        const version = getLocalStorageVersion(key);
+        response = { action: 'localstorage_value', request_id: requestId, key, value, version };
+        break;
+      }
+      
+      case 'get_localstorage_version': {
+        const key = data.key as string;
+        const version = getLocalStorageVersion(key);
+        response = { action: 'localstorage_version', request_id: requestId, key, version };
         break;
       }
       
@@ -215,6 +363,44 @@ async function handleMessage(
     };
   }
   
+  return response;
+}
+
+/**
+ * Handle messages from workers via BroadcastChannel
+ * 
+ * A 'batch' message carries several requests issued by the worker in the
+ * same event loop tick. Responses that become ready together are answered
+ * with a single 'batch_response' message, so quick requests (e.g. localStorage)
+ * are not held back by slow ones (e.g. bundle downloads).
+ * 
+ * Responses echo the client_id of the request, since the bridges of all
+ * workers listen on the same channel.
+ */
+async function handleMessage(
+  data: Record<string, unknown>,
+  channel: BroadcastChannel
+): Promise<void> {
+  if (data.action === 'batch') {
+    const requests = (data.requests || []) as Record<string, unknown>[];
+    const responses: Record<string, unknown>[] = [];
+    const flush = () => {
+      const batch = responses.splice(0);
+      if (DEBUG()) console.log('operaton-bridge: Sending batch response:', batch.length, 'responses');
+      channel.postMessage({ action: 'batch_response', client_id: data.client_id, responses: batch });
+    };
+    for (const request of requests) {
+      dispatchRequest(request).then((response) => {
+        if (responses.push(response) === 1) {
+          setTimeout(flush, 0);
+        }
+      });
+    }
+    return;
+  }
+  
+  const response = await dispatchRequest(data);
+  response.client_id = data.client_id;
   if (DEBUG()) console.log('operaton-bridge: Sending response:', { action: response.action, request_id: response.request_id, hasBundle: 'bundle' in response });
   channel.postMessage(response);
   if (DEBUG()) console.log('operaton-bridge: Response sent');